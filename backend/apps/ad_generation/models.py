@@ -7,7 +7,7 @@ from datetime import datetime
 from mongoengine import (
     Document, EmbeddedDocument, StringField, IntField, FloatField, 
     BooleanField, DateTimeField, ListField, DictField, ReferenceField,
-    EmbeddedDocumentField, PULL, CASCADE
+    EmbeddedDocumentField, CASCADE
 )
 from enum import Enum
 
@@ -41,6 +41,13 @@ class Platform(str, Enum):
     TIKTOK = "tiktok"
 
 
+# Enum values are immutable, so build the choice tuples once at import
+# instead of re-iterating the enums for every field declaration.
+CREATIVE_TYPE_CHOICES = tuple(ct.value for ct in CreativeType)
+GENERATION_STATUS_CHOICES = tuple(gs.value for gs in GenerationStatus)
+PLATFORM_CHOICES = tuple(p.value for p in Platform)
+
+
 class CreativeTemplate(Document):
     """MongoDB template for creative generation."""
     
@@ -50,8 +57,8 @@ class CreativeTemplate(Document):
     tenant_id = StringField(required=True, max_length=100)  # Multi-tenant support
     
     # Template configuration
-    creative_type = StringField(required=True, choices=[ct.value for ct in CreativeType])
-    platform = StringField(required=True, choices=[p.value for p in Platform])
+    creative_type = StringField(required=True, choices=CREATIVE_TYPE_CHOICES)
+    platform = StringField(required=True, choices=PLATFORM_CHOICES)
     dimensions = DictField()  # e.g., {"width": 1080, "height": 1920}
     
     # AI generation parameters
@@ -94,7 +101,7 @@ class Campaign(Document):
     tenant_id = StringField(required=True, max_length=100)
     
     # Campaign configuration
-    target_platforms = ListField(StringField(choices=[p.value for p in Platform]))
+    target_platforms = ListField(StringField(choices=PLATFORM_CHOICES))
     budget = FloatField(min_value=0)
     target_audience = DictField()  # Demographics, interests, etc.
     campaign_objectives = ListField(StringField())
@@ -152,8 +159,8 @@ class Creative(Document):
     template = ReferenceField(CreativeTemplate)
     
     # Creative configuration
-    creative_type = StringField(required=True, choices=[ct.value for ct in CreativeType])
-    target_platform = StringField(required=True, choices=[p.value for p in Platform])
+    creative_type = StringField(required=True, choices=CREATIVE_TYPE_CHOICES)
+    target_platform = StringField(required=True, choices=PLATFORM_CHOICES)
     content_brief = StringField(required=True)  # Brief for AI generation
     
     # Generated variations
@@ -202,12 +209,12 @@ class GenerationJob(Document):
     template = ReferenceField(CreativeTemplate)
     
     # Job configuration
-    generation_type = StringField(required=True, choices=[ct.value for ct in CreativeType])
+    generation_type = StringField(required=True, choices=CREATIVE_TYPE_CHOICES)
     input_parameters = DictField(required=True)  # Parameters for generation
     ai_service = StringField(required=True)  # Which AI service to use
     
     # Job status
-    status = StringField(required=True, choices=[gs.value for gs in GenerationStatus], default=GenerationStatus.PENDING.value)
+    status = StringField(required=True, choices=GENERATION_STATUS_CHOICES, default=GenerationStatus.PENDING.value)
     progress_percentage = IntField(min_value=0, max_value=100, default=0)
     error_message = StringField()
     
@@ -275,7 +282,7 @@ class CreativeMetrics(Document):
     # Core fields
     tenant_id = StringField(required=True, max_length=100)
     creative = ReferenceField(Creative, reverse_delete_rule=CASCADE)
-    platform = StringField(required=True, choices=[p.value for p in Platform])
+    platform = StringField(required=True, choices=PLATFORM_CHOICES)
     
     # Time period
     date = DateTimeField(required=True)
@@ -5,13 +5,35 @@ These serializers handle the conversion between MongoDB documents and JSON
 for the REST API, implementing validation and data transformation.
 """
 
+from operator import attrgetter
 from rest_framework import serializers
 from bson import ObjectId
 from apps.ad_generation.models import (
-    Campaign, Creative, CreativeVariation, GenerationJob, 
-    CreativeTemplate, CreativeMetrics, CreativeType, Platform, GenerationStatus
+    Campaign, Creative, GenerationJob, 
+    CreativeTemplate, CreativeMetrics, GenerationStatus,
+    CREATIVE_TYPE_CHOICES, GENERATION_STATUS_CHOICES, PLATFORM_CHOICES
 )
 
+METRIC_COUNTER_FIELDS = ('impressions', 'clicks', 'conversions', 'spend')
+
+_metric_counters = attrgetter(*METRIC_COUNTER_FIELDS)
+
+
+def sum_metrics(metrics):
+    """
+    Accumulate impressions, clicks, conversions and spend in a single pass.
+
+    Returns a (impressions, clicks, conversions, spend) tuple.
+    """
+    impressions, clicks, conversions, spend = 0, 0, 0, 0.0
+    for metric in metrics:
+        m_impressions, m_clicks, m_conversions, m_spend = _metric_counters(metric)
+        impressions += m_impressions
+        clicks += m_clicks
+        conversions += m_conversions
+        spend += m_spend
+    return impressions, clicks, conversions, spend
+
 
 class ObjectIdField(serializers.Field):
     """Custom field for MongoDB ObjectId serialization."""
@@ -44,8 +66,8 @@ class CreativeTemplateSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=200)
     description = serializers.CharField(max_length=1000, required=False)
     tenant_id = serializers.CharField(max_length=100)
-    creative_type = serializers.ChoiceField(choices=[ct.value for ct in CreativeType])
-    platform = serializers.ChoiceField(choices=[p.value for p in Platform])
+    creative_type = serializers.ChoiceField(choices=CREATIVE_TYPE_CHOICES)
+    platform = serializers.ChoiceField(choices=PLATFORM_CHOICES)
     dimensions = serializers.DictField(required=False)
     prompt_template = serializers.CharField()
     style_parameters = serializers.DictField(required=False)
@@ -94,7 +116,7 @@ class CampaignSerializer(serializers.Serializer):
     description = serializers.CharField(max_length=1000, required=False)
     tenant_id = serializers.CharField(max_length=100)
     target_platforms = serializers.ListField(
-        child=serializers.ChoiceField(choices=[p.value for p in Platform]),
+        child=serializers.ChoiceField(choices=PLATFORM_CHOICES),
         required=False
     )
     budget = serializers.FloatField(min_value=0, required=False)
@@ -115,20 +137,10 @@ class CampaignSerializer(serializers.Serializer):
     
     def get_performance_summary(self, obj):
         """Get summarized performance metrics for this campaign."""
-        creatives = Creative.objects(campaign=obj)
-        total_impressions = 0
-        total_clicks = 0
-        total_conversions = 0
-        total_spend = 0.0
-        
-        for creative in creatives:
-            metrics = CreativeMetrics.objects(creative=creative)
-            for metric in metrics:
-                total_impressions += metric.impressions
-                total_clicks += metric.clicks
-                total_conversions += metric.conversions
-                total_spend += metric.spend
-        
+        # One metrics query for the whole campaign instead of one per creative
+        creative_ids = Creative.objects(campaign=obj).scalar('id')
+        metrics = CreativeMetrics.objects(creative__in=creative_ids).only(*METRIC_COUNTER_FIELDS)
+        total_impressions, total_clicks, total_conversions, total_spend = sum_metrics(metrics)
         average_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
         
         return {
@@ -183,8 +195,8 @@ class CreativeSerializer(serializers.Serializer):
     template_id = ObjectIdField(write_only=True, required=False)
     campaign_name = serializers.SerializerMethodField()
     template_name = serializers.SerializerMethodField()
-    creative_type = serializers.ChoiceField(choices=[ct.value for ct in CreativeType])
-    target_platform = serializers.ChoiceField(choices=[p.value for p in Platform])
+    creative_type = serializers.ChoiceField(choices=CREATIVE_TYPE_CHOICES)
+    target_platform = serializers.ChoiceField(choices=PLATFORM_CHOICES)
     content_brief = serializers.CharField()
     variations = CreativeVariationSerializer(many=True, read_only=True)
     selected_variation = serializers.CharField(required=False)
@@ -206,10 +218,7 @@ class CreativeSerializer(serializers.Serializer):
     def get_metrics_summary(self, obj):
         """Get summarized metrics for this creative."""
         metrics = CreativeMetrics.objects(creative=obj)
-        total_impressions = sum(m.impressions for m in metrics)
-        total_clicks = sum(m.clicks for m in metrics)
-        total_conversions = sum(m.conversions for m in metrics)
-        total_spend = sum(m.spend for m in metrics)
+        total_impressions, total_clicks, total_conversions, total_spend = sum_metrics(metrics)
         
         return {
             'total_impressions': total_impressions,
@@ -309,10 +318,10 @@ class GenerationJobSerializer(serializers.Serializer):
     template_id = ObjectIdField(write_only=True, required=False)
     creative_name = serializers.SerializerMethodField()
     template_name = serializers.SerializerMethodField()
-    generation_type = serializers.ChoiceField(choices=[ct.value for ct in CreativeType])
+    generation_type = serializers.ChoiceField(choices=CREATIVE_TYPE_CHOICES)
     input_parameters = serializers.DictField()
     ai_service = serializers.CharField()
-    status = serializers.ChoiceField(choices=[gs.value for gs in GenerationStatus], default=GenerationStatus.PENDING.value)
+    status = serializers.ChoiceField(choices=GENERATION_STATUS_CHOICES, default=GenerationStatus.PENDING.value)
     progress_percentage = serializers.IntegerField(min_value=0, max_value=100, default=0)
     error_message = serializers.CharField(required=False)
     generated_content = serializers.DictField(required=False)
@@ -401,7 +410,7 @@ class CreativeMetricsSerializer(serializers.Serializer):
     tenant_id = serializers.CharField(max_length=100)
     creative_id = ObjectIdField(write_only=True)
     creative_name = serializers.SerializerMethodField()
-    platform = serializers.ChoiceField(choices=[p.value for p in Platform])
+    platform = serializers.ChoiceField(choices=PLATFORM_CHOICES)
     date = serializers.DateTimeField()
     period_type = serializers.ChoiceField(choices=['daily', 'weekly', 'monthly'], default='daily')
     impressions = serializers.IntegerField(min_value=0, default=0)
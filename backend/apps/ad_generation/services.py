@@ -6,14 +6,18 @@ Generative AI models (Gemini, Imagen, Veo) as outlined in the architectural blue
 """
 
 import logging
-import asyncio
-from typing import Dict, List, Optional, Any, Union
+import hashlib
+import time
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from google.cloud import aiplatform
 from google.oauth2 import service_account
-from apps.core.plugins import AdCreativeGeneratorPlugin, plugin_registry
+from apps.core.plugins import AdCreativeGeneratorPlugin
+from apps.core.services import CacheService
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +49,7 @@ class CreativeFormat(Enum):
     SOCIAL_VIDEO = "social_video"
 
 
-@dataclass
+@dataclass(slots=True)
 class CreativePrompt:
     """Structured prompt for creative generation."""
     text: str
@@ -57,7 +61,7 @@ class CreativePrompt:
     constraints: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedCreative:
     """Container for generated creative content."""
     content: Union[str, bytes, Dict[str, Any]]
@@ -70,6 +74,25 @@ class GeneratedCreative:
     quality_score: Optional[float] = None
 
 
+# Role prompts are static, so every PromptEngineer shares one read-only mapping
+ROLE_PROMPTS = MappingProxyType({
+    CreativeType.TEXT: (
+        "You are an expert creative director at a world-class advertising agency "
+        "specializing in direct-to-consumer brands. You excel at creating compelling, "
+        "conversion-focused copy that resonates with specific target audiences."
+    ),
+    CreativeType.IMAGE: (
+        "You are a master visual creative director with expertise in advertising "
+        "photography and design. You create detailed visual concepts that translate "
+        "into high-converting visual advertisements."
+    ),
+    CreativeType.VIDEO: (
+        "You are an award-winning creative director specializing in video advertising. "
+        "You craft cinematic concepts that tell compelling brand stories and drive action."
+    )
+})
+
+
 class PromptEngineer:
     """
     Advanced prompt engineering for optimal AI model performance.
@@ -82,22 +105,7 @@ class PromptEngineer:
     """
     
     def __init__(self):
-        self.role_prompts = {
-            CreativeType.TEXT: (
-                "You are an expert creative director at a world-class advertising agency "
-                "specializing in direct-to-consumer brands. You excel at creating compelling, "
-                "conversion-focused copy that resonates with specific target audiences."
-            ),
-            CreativeType.IMAGE: (
-                "You are a master visual creative director with expertise in advertising "
-                "photography and design. You create detailed visual concepts that translate "
-                "into high-converting visual advertisements."
-            ),
-            CreativeType.VIDEO: (
-                "You are an award-winning creative director specializing in video advertising. "
-                "You craft cinematic concepts that tell compelling brand stories and drive action."
-            )
-        }
+        self.role_prompts = ROLE_PROMPTS
     
     def engineer_prompt(self, prompt: CreativePrompt, creative_type: CreativeType) -> str:
         """
@@ -220,6 +228,8 @@ class AdGenerationService:
     def __init__(self):
         """Initialize the ad generation service."""
         self.prompt_engineer = PromptEngineer()
+        self.cache = CacheService()
+        self.cache_timeout = getattr(settings, 'CREATIVE_CACHE_TIMEOUT', 3600)
         self._initialize_ai_clients()
     
     def _initialize_ai_clients(self):
@@ -251,7 +261,8 @@ class AdGenerationService:
         self,
         prompt: CreativePrompt,
         creative_type: CreativeType,
-        creative_format: CreativeFormat
+        creative_format: CreativeFormat,
+        tenant_id: Optional[str] = None
     ) -> GeneratedCreative:
         """
         Generate a creative based on the provided prompt and specifications.
@@ -260,30 +271,40 @@ class AdGenerationService:
             prompt: The creative prompt with requirements
             creative_type: Type of creative to generate
             creative_format: Specific format for the creative
+            tenant_id: Tenant the creative belongs to; responses are only
+                cached when it is given, so tenants never share creatives
             
         Returns:
             Generated creative with content and metadata
         """
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             # Engineer the prompt for optimal performance
             engineered_prompt = self.prompt_engineer.engineer_prompt(prompt, creative_type)
             
-            # Route to appropriate generation method
-            if creative_type == CreativeType.TEXT:
-                content = await self._generate_text_creative(engineered_prompt, creative_format)
-                model_used = "gemini-pro"
-            elif creative_type == CreativeType.IMAGE:
-                content = await self._generate_image_creative(engineered_prompt, creative_format)
-                model_used = "imagen-3"
-            elif creative_type == CreativeType.VIDEO:
-                content = await self._generate_video_creative(engineered_prompt, creative_format)
-                model_used = "veo"
+            # Identical engineered prompts produce identical requests to the
+            # model, so serve a tenant's repeats from the cache instead of
+            # regenerating. The cache is synchronous, so keep it off the loop.
+            cache_key = None
+            cached = None
+            if tenant_id is not None:
+                cache_key = self._get_cache_key(
+                    tenant_id, engineered_prompt, creative_type, creative_format
+                )
+                cached = await sync_to_async(self.cache.get)(cache_key)
+            if cached is not None:
+                content, model_used = cached
             else:
-                raise ValueError(f"Unsupported creative type: {creative_type}")
+                content, model_used = await self._generate_content(
+                    engineered_prompt, creative_type, creative_format
+                )
+                if cache_key is not None:
+                    await sync_to_async(self.cache.set)(
+                        cache_key, (content, model_used), self.cache_timeout
+                    )
             
-            generation_time = asyncio.get_event_loop().time() - start_time
+            generation_time = time.perf_counter() - start_time
             
             # Create the generated creative object
             generated_creative = GeneratedCreative(
@@ -305,8 +326,11 @@ class AdGenerationService:
             # Store the creative (would integrate with database)
             await self._store_creative(generated_creative)
             
-            # Generate and store embeddings for similarity search
-            await self._generate_embeddings(generated_creative)
+            # Generate and store embeddings for similarity search; a cache
+            # hit has the same content as an earlier creative, so its
+            # embeddings already exist
+            if cached is None:
+                await self._generate_embeddings(generated_creative)
             
             return generated_creative
             
@@ -314,6 +338,40 @@ class AdGenerationService:
             logger.error(f"Error generating creative: {e}")
             raise
     
+    @staticmethod
+    def _get_cache_key(
+        tenant_id: str,
+        engineered_prompt: str,
+        creative_type: CreativeType,
+        creative_format: CreativeFormat
+    ) -> str:
+        """Build a tenant's response cache key for an engineered prompt."""
+        digest = hashlib.sha256(engineered_prompt.encode('utf-8')).hexdigest()
+        return f"creative:{tenant_id}:{creative_type.value}:{creative_format.value}:{digest}"
+    
+    async def _generate_content(
+        self,
+        engineered_prompt: str,
+        creative_type: CreativeType,
+        creative_format: CreativeFormat
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Route the prompt to the model for the creative type.
+        
+        Returns:
+            Tuple of (generated content, model name)
+        """
+        if creative_type == CreativeType.TEXT:
+            content = await self._generate_text_creative(engineered_prompt, creative_format)
+            return content, "gemini-pro"
+        elif creative_type == CreativeType.IMAGE:
+            content = await self._generate_image_creative(engineered_prompt, creative_format)
+            return content, "imagen-3"
+        elif creative_type == CreativeType.VIDEO:
+            content = await self._generate_video_creative(engineered_prompt, creative_format)
+            return content, "veo"
+        raise ValueError(f"Unsupported creative type: {creative_type}")
+    
     async def _generate_text_creative(self, prompt: str, format_type: CreativeFormat) -> Dict[str, Any]:
         """Generate text-based creative using Gemini."""
         # This would integrate with Google's Gemini API
@@ -353,12 +411,29 @@ class AdGenerationService:
     async def _store_creative(self, creative: GeneratedCreative):
         """Store the generated creative in the database."""
         # This would integrate with the database models
-        logger.info(f"Storing creative: {creative.creative_type.value}")
+        logger.debug("Storing creative: %s", creative.creative_type.value)
     
     async def _generate_embeddings(self, creative: GeneratedCreative):
         """Generate and store vector embeddings for the creative."""
         # This would integrate with the vector database (Qdrant)
-        logger.info(f"Generating embeddings for creative: {creative.creative_type.value}")
+        logger.debug("Generating embeddings for creative: %s", creative.creative_type.value)
+
+
+_shared_service: Optional[AdGenerationService] = None
+
+
+def get_ad_generation_service() -> AdGenerationService:
+    """
+    Return the process-wide AdGenerationService, creating it on first use.
+    
+    Building the service initialises the Vertex AI client, so the generator
+    plugins share one instance (and its response cache) instead of each
+    constructing their own.
+    """
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = AdGenerationService()
+    return _shared_service
 
 
 class GeminiTextGeneratorPlugin(AdCreativeGeneratorPlugin):
@@ -372,11 +447,11 @@ class GeminiTextGeneratorPlugin(AdCreativeGeneratorPlugin):
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the Gemini text generator plugin."""
         super().__init__(config)
-        self.service = AdGenerationService()
+        self.service = get_ad_generation_service()
     
     def initialize(self):
         """Initialize the plugin."""
-        logger.info("Initializing Gemini Text Generator Plugin")
+        logger.debug("Initializing Gemini Text Generator Plugin")
     
     async def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """Generate text creative using Gemini."""
@@ -394,7 +469,8 @@ class GeminiTextGeneratorPlugin(AdCreativeGeneratorPlugin):
         result = await self.service.generate_creative(
             creative_prompt,
             CreativeType.TEXT,
-            creative_format
+            creative_format,
+            tenant_id=kwargs.get('tenant_id')
         )
         
         return {
@@ -417,11 +493,11 @@ class ImagenImageGeneratorPlugin(AdCreativeGeneratorPlugin):
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the Imagen generator plugin."""
         super().__init__(config)
-        self.service = AdGenerationService()
+        self.service = get_ad_generation_service()
     
     def initialize(self):
         """Initialize the plugin."""
-        logger.info("Initializing Imagen Image Generator Plugin")
+        logger.debug("Initializing Imagen Image Generator Plugin")
     
     async def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """Generate image creative using Imagen."""
@@ -439,7 +515,8 @@ class ImagenImageGeneratorPlugin(AdCreativeGeneratorPlugin):
         result = await self.service.generate_creative(
             creative_prompt,
             CreativeType.IMAGE,
-            creative_format
+            creative_format,
+            tenant_id=kwargs.get('tenant_id')
         )
         
         return {
@@ -462,11 +539,11 @@ class VeoVideoGeneratorPlugin(AdCreativeGeneratorPlugin):
     def __init__(self, config: Optional[Dict] = None):
         """Initialize the Veo generator plugin."""
         super().__init__(config)
-        self.service = AdGenerationService()
+        self.service = get_ad_generation_service()
     
     def initialize(self):
         """Initialize the plugin."""
-        logger.info("Initializing Veo Video Generator Plugin")
+        logger.debug("Initializing Veo Video Generator Plugin")
     
     async def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
         """Generate video creative using Veo."""
@@ -484,7 +561,8 @@ class VeoVideoGeneratorPlugin(AdCreativeGeneratorPlugin):
         result = await self.service.generate_creative(
             creative_prompt,
             CreativeType.VIDEO,
-            creative_format
+            creative_format,
+            tenant_id=kwargs.get('tenant_id')
         )
         
         return {
@@ -12,17 +12,19 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from bson import ObjectId
 from bson.errors import InvalidId
+from collections import ChainMap
 from datetime import datetime, timedelta
 import logging
 import uuid
 
 from apps.ad_generation.models import (
-    Campaign, Creative, CreativeVariation, GenerationJob,
-    CreativeTemplate, CreativeMetrics, get_tenant_documents
+    Campaign, Creative, GenerationJob,
+    CreativeTemplate, CreativeMetrics
 )
 from apps.ad_generation.serializers import (
     CampaignSerializer, CreativeSerializer, 
-    GenerationJobSerializer, CreativeTemplateSerializer, CreativeMetricsSerializer
+    GenerationJobSerializer, CreativeTemplateSerializer, CreativeMetricsSerializer,
+    METRIC_COUNTER_FIELDS, sum_metrics
 )
 # from apps.ad_generation.services import AdGenerationService
 # from apps.core.permissions import TenantBasedPermission
@@ -30,6 +32,23 @@ from apps.ad_generation.serializers import (
 logger = logging.getLogger(__name__)
 
 
+def with_overrides(data, **overrides):
+    """
+    Layer server-side fields over the request payload for a serializer.
+    
+    JSON payloads are plain dicts, so the overrides are chained in front
+    of them instead of copying the whole body. Form payloads (QueryDict)
+    still get a real copy, because serializers need ``getlist`` for
+    multi-value fields and ChainMap does not provide it.
+    """
+    if hasattr(data, 'getlist'):
+        data = data.copy()
+        for key, value in overrides.items():
+            data[key] = value
+        return data
+    return ChainMap(overrides, data)
+
+
 class CampaignListCreateView(APIView):
     """List all campaigns or create a new campaign."""
     
@@ -45,9 +64,11 @@ class CampaignListCreateView(APIView):
     def post(self, request):
         """Create a new campaign."""
         tenant_id = getattr(request, 'tenant_id', 'default')
-        data = request.data.copy()
-        data['tenant_id'] = tenant_id
-        data['created_by'] = str(request.user.id) if request.user.is_authenticated else 'anonymous'
+        data = with_overrides(
+            request.data,
+            tenant_id=tenant_id,
+            created_by=str(request.user.id) if request.user.is_authenticated else 'anonymous',
+        )
         
         serializer = CampaignSerializer(data=data)
         if serializer.is_valid():
@@ -129,9 +150,11 @@ class CreativeListCreateView(APIView):
     def post(self, request):
         """Create a new creative."""
         tenant_id = getattr(request, 'tenant_id', 'default')
-        data = request.data.copy()
-        data['tenant_id'] = tenant_id
-        data['created_by'] = str(request.user.id) if request.user.is_authenticated else 'anonymous'
+        data = with_overrides(
+            request.data,
+            tenant_id=tenant_id,
+            created_by=str(request.user.id) if request.user.is_authenticated else 'anonymous',
+        )
         
         serializer = CreativeSerializer(data=data)
         if serializer.is_valid():
@@ -202,9 +225,11 @@ class CreativeTemplateListCreateView(APIView):
     def post(self, request):
         """Create a new template."""
         tenant_id = getattr(request, 'tenant_id', 'default')
-        data = request.data.copy()
-        data['tenant_id'] = tenant_id
-        data['created_by'] = str(request.user.id) if request.user.is_authenticated else 'anonymous'
+        data = with_overrides(
+            request.data,
+            tenant_id=tenant_id,
+            created_by=str(request.user.id) if request.user.is_authenticated else 'anonymous',
+        )
         
         serializer = CreativeTemplateSerializer(data=data)
         if serializer.is_valid():
@@ -275,10 +300,12 @@ class GenerationJobListCreateView(APIView):
     def post(self, request):
         """Create a new generation job."""
         tenant_id = getattr(request, 'tenant_id', 'default')
-        data = request.data.copy()
-        data['tenant_id'] = tenant_id
-        data['job_id'] = str(uuid.uuid4())
-        data['created_by'] = str(request.user.id) if request.user.is_authenticated else 'anonymous'
+        data = with_overrides(
+            request.data,
+            tenant_id=tenant_id,
+            job_id=str(uuid.uuid4()),
+            created_by=str(request.user.id) if request.user.is_authenticated else 'anonymous',
+        )
         
         serializer = GenerationJobSerializer(data=data)
         if serializer.is_valid():
@@ -368,9 +395,7 @@ class CreativeMetricsView(APIView):
         except (Creative.DoesNotExist, InvalidId):
             return Response({'error': 'Creative not found'}, status=status.HTTP_404_NOT_FOUND)
         
-        data = request.data.copy()
-        data['tenant_id'] = tenant_id
-        data['creative_id'] = creative_id
+        data = with_overrides(request.data, tenant_id=tenant_id, creative_id=creative_id)
         
         serializer = CreativeMetricsSerializer(data=data)
         if serializer.is_valid():
@@ -398,23 +423,13 @@ def analytics_dashboard(request):
     # Get recent generation jobs
     recent_jobs = GenerationJob.objects(tenant_id=tenant_id).order_by('-created_at')[:10]
     
-    # Aggregate metrics
-    total_impressions = 0
-    total_clicks = 0
-    total_conversions = 0
-    total_spend = 0.0
-    
-    for creative in creatives:
-        metrics = CreativeMetrics.objects(
-            creative=creative,
-            date__gte=start_date,
-            date__lte=end_date
-        )
-        for metric in metrics:
-            total_impressions += metric.impressions
-            total_clicks += metric.clicks
-            total_conversions += metric.conversions
-            total_spend += metric.spend
+    # Aggregate metrics for all creatives in a single query
+    metrics = CreativeMetrics.objects(
+        creative__in=creatives.scalar('id'),
+        date__gte=start_date,
+        date__lte=end_date
+    ).only(*METRIC_COUNTER_FIELDS)
+    total_impressions, total_clicks, total_conversions, total_spend = sum_metrics(metrics)
     
     # Calculate derived metrics
     ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
@@ -6,9 +6,24 @@ It dynamically routes database queries to tenant-specific databases based on the
 """
 
 import threading
-from django.conf import settings
 from typing import Optional
 
+# Apps that contain public/shared data
+PUBLIC_APPS = frozenset({
+    'auth',           # Django auth models
+    'sessions',       # Django sessions
+    'admin',          # Django admin
+    'contenttypes',   # Django content types
+    'tenants',        # Tenant metadata
+    'users',          # User models (shared across tenants)
+})
+
+
+class _TenantLocal(threading.local):
+    """Thread-local tenant context that always has a ``tenant_db`` attribute."""
+    
+    tenant_db: Optional[str] = None
+
 
 class MultiTenantDBRouter:
     """
@@ -21,7 +36,7 @@ class MultiTenantDBRouter:
     """
     
     # Thread-local storage for current tenant context
-    _local = threading.local()
+    _local = _TenantLocal()
     
     @classmethod
     def set_tenant_db(cls, tenant_db_name: Optional[str]):
@@ -31,7 +46,7 @@ class MultiTenantDBRouter:
     @classmethod
     def get_tenant_db(cls) -> Optional[str]:
         """Get the current tenant database for this thread."""
-        return getattr(cls._local, 'tenant_db', None)
+        return cls._local.tenant_db
     
     @classmethod
     def clear_tenant_db(cls):
@@ -93,17 +108,7 @@ class MultiTenantDBRouter:
     
     def _is_public_app(self, app_label: str) -> bool:
         """Check if an app contains public (shared) models."""
-        # Apps that contain public/shared data
-        public_apps = {
-            'auth',           # Django auth models
-            'sessions',       # Django sessions
-            'admin',          # Django admin
-            'contenttypes',   # Django content types
-            'tenants',        # Tenant metadata
-            'users',          # User models (shared across tenants)
-        }
-        
-        return app_label in public_apps
+        return app_label in PUBLIC_APPS
 
 
 class TenantContext:
@@ -9,15 +9,22 @@ This middleware implements the database-per-tenant routing by:
 
 import logging
 from django.http import HttpResponse
-from django.conf import settings
-from django.core.cache import cache
 from django.utils.deprecation import MiddlewareMixin
 from apps.core.db_router import MultiTenantDBRouter
-from apps.tenants.models import Tenant
 from apps.tenants.utils import get_tenant_from_request
 
 logger = logging.getLogger(__name__)
 
+# Public endpoints that don't require tenant context
+PUBLIC_PATH_PREFIXES = (
+    '/api/v1/auth/',
+    '/api/v1/public/',
+    '/api/v1/health/',
+    '/admin/',
+    '/api/schema/',
+    '/api/docs/',
+)
+
 
 class TenantMiddleware(MiddlewareMixin):
     """
@@ -45,7 +52,7 @@ class TenantMiddleware(MiddlewareMixin):
                 request.tenant = tenant
                 request.tenant_db = tenant_db
                 
-                logger.debug(f"Tenant context set: {tenant.slug} -> {tenant_db}")
+                logger.debug("Tenant context set: %s -> %s", tenant.slug, tenant_db)
             else:
                 # Handle requests without valid tenant context
                 if self._requires_tenant_context(request):
@@ -80,20 +87,9 @@ class TenantMiddleware(MiddlewareMixin):
         """Check if the request requires a valid tenant context."""
         path = request.path_info
         
-        # Public endpoints that don't require tenant context
-        public_paths = [
-            '/api/v1/auth/',
-            '/api/v1/public/',
-            '/api/v1/health/',
-            '/admin/',
-            '/api/schema/',
-            '/api/docs/',
-        ]
-        
         # Check if path starts with any public path
-        for public_path in public_paths:
-            if path.startswith(public_path):
-                return False
+        if path.startswith(PUBLIC_PATH_PREFIXES):
+            return False
         
         # API endpoints generally require tenant context
         if path.startswith('/api/v1/'):
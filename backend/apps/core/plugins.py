@@ -47,7 +47,7 @@ class PluginRegistry:
         self._plugins[plugin_name] = plugin_instance
         self._plugin_configs[plugin_name] = config or {}
         
-        logger.info(f"Plugin registered: {plugin_name}")
+        logger.debug("Plugin registered: %s", plugin_name)
     
     def get(self, plugin_name: str) -> Optional[Any]:
         """
@@ -252,7 +252,11 @@ class PluginLoader:
         for app_config in apps.get_app_configs():
             self._load_plugins_from_app(app_config)
         
-        logger.info(f"Plugin discovery complete. Loaded {len(self.registry.list_plugins())} plugins.")
+        plugin_names = self.registry.list_plugins()
+        logger.info(
+            "Plugin discovery complete. Loaded %d plugins: %s",
+            len(plugin_names), ", ".join(plugin_names)
+        )
     
     def _load_plugins_from_app(self, app_config):
         """
@@ -306,8 +310,6 @@ class PluginLoader:
                 # Register with the registry
                 plugin_name = f"{app_name}.{plugin_class.__name__}"
                 self.registry.register(plugin_name, plugin_instance, plugin_config)
-                
-                logger.info(f"Loaded plugin: {plugin_name}")
             else:
                 logger.info(f"Plugin disabled: {plugin_class.__name__}")
                 
@@ -3,13 +3,34 @@ Core services for the AdGenius platform.
 These services provide shared functionality across all apps.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from typing import Any, Dict, List, Optional
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def cache_operation(operation: str, fallback: Any = False):
+    """
+    Decorator that logs and swallows cache backend errors.
+    
+    A cache outage should degrade to a miss rather than fail the request,
+    so the wrapped method returns ``fallback`` on error. If ``fallback`` is
+    callable it is called with the method's arguments after ``key``.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, key, *args, **kwargs):
+            try:
+                return method(self, key, *args, **kwargs)
+            except Exception as e:
+                self.logger.error("Cache %s error for key %s: %s", operation, key, e)
+                return fallback(*args, **kwargs) if callable(fallback) else fallback
+        return wrapper
+    return decorator
+
+
 class BaseService(ABC):
     """
     Abstract base class for all services in the platform.
@@ -19,11 +40,14 @@ class BaseService(ABC):
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__module__)
     
-    def log_operation(self, operation: str, **kwargs):
+    def log_operation(self, operation: str, *args, **kwargs):
         """
         Log service operations for debugging and monitoring.
+        
+        ``operation`` may contain %-style placeholders filled from ``args``,
+        so the message is only formatted when INFO is enabled.
         """
-        self.logger.info(f"{self.__class__.__name__}: {operation}", extra=kwargs)
+        self.logger.info("%s: " + operation, self.__class__.__name__, *args, extra=kwargs)
 
 
 class CacheService(BaseService):
@@ -36,35 +60,26 @@ class CacheService(BaseService):
         from django.core.cache import cache
         self.cache = cache_backend or cache
     
+    @cache_operation('get', fallback=lambda default=None: default)
     def get(self, key: str, default=None):
         """
         Get value from cache.
         """
-        try:
-            return self.cache.get(key, default)
-        except Exception as e:
-            self.logger.error(f"Cache get error for key {key}: {e}")
-            return default
+        return self.cache.get(key, default)
     
+    @cache_operation('set')
     def set(self, key: str, value: Any, timeout: Optional[int] = None):
         """
         Set value in cache.
         """
-        try:
-            return self.cache.set(key, value, timeout)
-        except Exception as e:
-            self.logger.error(f"Cache set error for key {key}: {e}")
-            return False
+        return self.cache.set(key, value, timeout)
     
+    @cache_operation('delete')
     def delete(self, key: str):
         """
         Delete value from cache.
         """
-        try:
-            return self.cache.delete(key)
-        except Exception as e:
-            self.logger.error(f"Cache delete error for key {key}: {e}")
-            return False
+        return self.cache.delete(key)
     
     def get_or_set(self, key: str, default_callable, timeout: Optional[int] = None):
         """
@@ -98,7 +113,7 @@ class EventService(BaseService):
         """
         Emit an event to all registered handlers.
         """
-        self.log_operation(f"Emitting event: {event_type}", data=data)
+        self.log_operation("Emitting event: %s", event_type, data=data)
         
         handlers = self.event_handlers.get(event_type, [])
         for handler in handlers:
@@ -119,11 +134,7 @@ class ValidationService(BaseService):
         Validate that required fields are present in data.
         Returns list of missing fields.
         """
-        missing_fields = []
-        for field in required_fields:
-            if field not in data or data[field] is None or data[field] == '':
-                missing_fields.append(field)
-        return missing_fields
+        return [field for field in required_fields if data.get(field) in (None, '')]
     
     @staticmethod
     def validate_email(email: str) -> bool:
@@ -9,25 +9,31 @@ from rest_framework import status
 from django.conf import settings
 
 
+# Both payloads only change on deploy, so they are built once at import
+HEALTH_RESPONSE = {
+    'status': 'healthy',
+    'version': '1.0.0',
+    'environment': getattr(settings, 'ENVIRONMENT', 'development')
+}
+
+API_INFO_RESPONSE = {
+    'name': 'AdGenius API',
+    'version': '1.0.0',
+    'description': 'Multi-Tenant Generative AI Advertising Platform',
+    'docs': '/api/schema/swagger-ui/',
+    'openapi': '/api/schema/',
+}
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def health_check(request):
     """Health check endpoint."""
-    return Response({
-        'status': 'healthy',
-        'version': '1.0.0',
-        'environment': getattr(settings, 'ENVIRONMENT', 'development')
-    }, status=status.HTTP_200_OK)
+    return Response(HEALTH_RESPONSE, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def api_info(request):
     """API information endpoint."""
-    return Response({
-        'name': 'AdGenius API',
-        'version': '1.0.0',
-        'description': 'Multi-Tenant Generative AI Advertising Platform',
-        'docs': '/api/schema/swagger-ui/',
-        'openapi': '/api/schema/',
-    }, status=status.HTTP_200_OK)
+    return Response(API_INFO_RESPONSE, status=status.HTTP_200_OK)
@@ -3,10 +3,33 @@ Utility functions for the Tenants app.
 """
 
 from django.http import HttpRequest
+from functools import lru_cache
 from typing import Optional
 import re
 
 
+# Main domains that tenant subdomains hang off, compiled once at import
+MAIN_DOMAIN_PATTERNS = tuple(
+    re.compile(rf'^([a-z0-9-]+)\.{domain_pattern}', re.IGNORECASE)
+    for domain_pattern in (
+        r'adgenius\.com$',
+        r'localhost$',
+        r'127\.0\.0\.1$',
+    )
+)
+
+# Common subdomains that never identify a tenant
+NON_TENANT_SUBDOMAINS = frozenset({'www', 'api', 'admin', 'app'})
+
+TENANT_SLUG_PATTERN = re.compile(r'^[a-z0-9-]+$')
+
+RESERVED_TENANT_SLUGS = frozenset({
+    'admin', 'api', 'app', 'www', 'mail', 'ftp', 'blog',
+    'help', 'support', 'docs', 'status', 'about', 'contact',
+    'privacy', 'terms', 'legal', 'security', 'billing'
+})
+
+
 def get_tenant_from_request(request: HttpRequest):
     """
     Extract tenant information from the request.
@@ -55,31 +78,26 @@ def get_tenant_from_request(request: HttpRequest):
     return None
 
 
+@lru_cache(maxsize=1024)
 def extract_subdomain(host: str) -> Optional[str]:
     """
     Extract subdomain from host.
     
+    Results are memoised per host: the mapping is pure and every request
+    resolves its tenant through here.
+    
     Args:
         host: The host string (e.g., 'acme.adgenius.com')
         
     Returns:
         Subdomain string or None if no subdomain found
     """
-    # Define your main domain patterns
-    main_domains = [
-        r'adgenius\.com$',
-        r'localhost$',
-        r'127\.0\.0\.1$',
-    ]
-    
-    for domain_pattern in main_domains:
-        # Create pattern to match subdomain
-        pattern = rf'^([a-z0-9-]+)\.{domain_pattern}'
-        match = re.match(pattern, host, re.IGNORECASE)
+    for pattern in MAIN_DOMAIN_PATTERNS:
+        match = pattern.match(host)
         if match:
             subdomain = match.group(1)
             # Exclude common non-tenant subdomains
-            if subdomain not in ['www', 'api', 'admin', 'app']:
+            if subdomain not in NON_TENANT_SUBDOMAINS:
                 return subdomain.lower()
     
     return None
@@ -113,7 +131,7 @@ def validate_tenant_slug(slug: str) -> bool:
         return False
     
     # Check format (lowercase letters, numbers, hyphens only)
-    if not re.match(r'^[a-z0-9-]+$', slug):
+    if not TENANT_SLUG_PATTERN.match(slug):
         return False
     
     # Check that it doesn't start or end with hyphen
@@ -121,13 +139,7 @@ def validate_tenant_slug(slug: str) -> bool:
         return False
     
     # Check for reserved words
-    reserved_words = [
-        'admin', 'api', 'app', 'www', 'mail', 'ftp', 'blog',
-        'help', 'support', 'docs', 'status', 'about', 'contact',
-        'privacy', 'terms', 'legal', 'security', 'billing'
-    ]
-    
-    if slug in reserved_words:
+    if slug in RESERVED_TENANT_SLUGS:
         return False
     
     return True
@@ -263,6 +263,9 @@ GEMINI_MODEL_NAME = config('GEMINI_MODEL_NAME', default='gemini-1.5-pro-latest')
 IMAGEN_MODEL_NAME = config('IMAGEN_MODEL_NAME', default='imagen-3.0-generate-001')
 VEO_MODEL_NAME = config('VEO_MODEL_NAME', default='veo-001')
 
+# Seconds to reuse a generated creative for an identical engineered prompt
+CREATIVE_CACHE_TIMEOUT = config('CREATIVE_CACHE_TIMEOUT', default=3600, cast=int)
+
 # Qdrant Vector Database Configuration
 QDRANT_HOST = config('QDRANT_HOST', default='localhost')
 QDRANT_PORT = int(config('QDRANT_PORT', default=6333))